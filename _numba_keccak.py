@@ -0,0 +1,116 @@
+"""Keccak-256 for Tessa, JIT-compiled with Numba.
+
+hashlib has no keccak_256 (the original Keccak padding used by Ethereum), and
+a pure-Python permutation is thousands of times slower than native code.
+tessa.py imports this module only when numba is installed.
+"""
+
+import numba
+import numpy as np
+
+RATE = 136  # bytes absorbed per permutation for a 256-bit capacity
+_RATE_LANES = RATE // 8
+
+_ROUND_CONSTANTS = np.array([
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+], dtype=np.uint64)
+
+# Rho rotation offsets, indexed by lane x + 5 * y.
+_ROTATIONS = np.array([
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+], dtype=np.uint64)
+
+
+@numba.njit(cache=True, nogil=True)
+def _rotl(value, shift):
+    if shift == 0:
+        return value
+    return (value << shift) | (value >> (np.uint64(64) - shift))
+
+
+@numba.njit(cache=True, nogil=True)
+def _keccak_f(state):
+    """Keccak-f[1600] permutation over a uint64[25] state, in place."""
+    c = np.empty(5, dtype=np.uint64)
+    b = np.empty(25, dtype=np.uint64)
+    for rnd in range(24):
+        for x in range(5):
+            c[x] = state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20]
+        for x in range(5):
+            d = c[(x + 4) % 5] ^ _rotl(c[(x + 1) % 5], np.uint64(1))
+            for y in range(0, 25, 5):
+                state[x + y] ^= d
+        for x in range(5):
+            for y in range(5):
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotl(state[x + 5 * y], _ROTATIONS[x + 5 * y])
+        for x in range(5):
+            for y in range(0, 25, 5):
+                state[x + y] = b[x + y] ^ (~b[(x + 1) % 5 + y] & b[(x + 2) % 5 + y])
+        state[0] ^= _ROUND_CONSTANTS[rnd]
+
+
+@numba.njit(cache=True, nogil=True)
+def _absorb(state, lanes):
+    """XOR whole rate-sized blocks of little-endian lanes into the state."""
+    for offset in range(0, lanes.shape[0], _RATE_LANES):
+        for i in range(_RATE_LANES):
+            state[i] ^= lanes[offset + i]
+        _keccak_f(state)
+
+
+def _lanes(data) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u8")
+
+
+class Keccak256:
+    """hashlib-style Keccak-256 object (update/digest/hexdigest/copy)."""
+
+    name = "keccak_256"
+    digest_size = 32
+    block_size = RATE
+
+    def __init__(self):
+        self._state = np.zeros(25, dtype=np.uint64)
+        self._tail = b""
+
+    def update(self, data):
+        view = memoryview(data).cast("B")
+        if self._tail:
+            need = RATE - len(self._tail)
+            if len(view) < need:
+                self._tail += bytes(view)
+                return
+            _absorb(self._state, _lanes(self._tail + bytes(view[:need])))
+            view = view[need:]
+            self._tail = b""
+        full = len(view) - len(view) % RATE
+        if full:
+            _absorb(self._state, _lanes(view[:full]))
+        self._tail = bytes(view[full:])
+
+    def copy(self) -> "Keccak256":
+        other = Keccak256.__new__(Keccak256)
+        other._state = self._state.copy()
+        other._tail = self._tail
+        return other
+
+    def digest(self) -> bytes:
+        block = bytearray(RATE)
+        block[:len(self._tail)] = self._tail
+        block[len(self._tail)] ^= 0x01
+        block[-1] ^= 0x80
+        state = self._state.copy()
+        _absorb(state, _lanes(bytes(block)))
+        return state.astype("<u8").tobytes()[:self.digest_size]
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
@@ -1,72 +1,367 @@
 #!/usr/bin/env python3
 
 import argparse
+import errno
+import functools
 import hashlib
+import hmac
+import importlib.util
+import io
+import mmap
 import os
+import queue
+import stat
 import sys
-from typing import Optional
-
-CHUNK_SIZE = 8192
+import threading
+import time
+from typing import BinaryIO, Optional, Union
+
+CHUNK_SIZE = 1 << 20  # 1 MiB keeps syscalls and interpreter round trips low
+MMAP_THRESHOLD = 4 << 20  # regular files at least this large are hashed via mmap
+READ_BUFFERS = 4  # chunks in flight between the reader thread and the hasher
+PROGRESS_INTERVAL = 0.25  # seconds between progress updates on a terminal
+PROGRESS_WINDOW = 64 << 20  # mmap bytes hashed per update() while showing progress
+DEFAULT_ALGORITHM = "blake2b"  # integrity-only use: faster than sha256 on 64-bit CPUs
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
+HEX_DIGITS = frozenset("0123456789abcdef")
+
 
+@functools.cache
+def _fixed_digest_algorithms() -> tuple[str, ...]:
+    """Filter out algorithms that require an explicit digest length.
 
-def _fixed_digest_algorithms():
-    """Filter out algorithms that require an explicit digest length."""
+    Probed on first use and cached, not at import.
+    """
     fixed = set()
     for name in hashlib.algorithms_available:
         candidate = name.lower()
         if candidate in fixed:
             continue
         try:
-            hashlib.new(candidate).hexdigest()
+            # Constructing still weeds out algorithms blocked on this build
+            # (e.g. md5 under FIPS); digest_size is 0 for XOFs and, unlike
+            # hexdigest(), hashes nothing.
+            if not hashlib.new(candidate).digest_size:
+                continue
         except (TypeError, ValueError):
             continue
         fixed.add(candidate)
+    # Optional backends are only located here and imported in _new_hash() once
+    # chosen; numba in particular (with NumPy) costs ~200 ms to import.
+    if importlib.util.find_spec("blake3") is not None:  # pip install blake3
+        fixed.add("blake3")
+    if all(importlib.util.find_spec(name) for name in ("numba", "_numba_keccak")):
+        fixed.add("keccak_256")
     return tuple(sorted(fixed))
 
 
-SUPPORTED_ALGORITHMS = _fixed_digest_algorithms()
-
-
-def compute_hash(file_path: str, algorithm: str) -> str:
-    """Compute hash of a file using the chosen algorithm."""
+@functools.cache
+def _supported_set() -> frozenset[str]:
+    return frozenset(_fixed_digest_algorithms())
+
+
+def __getattr__(name: str):
+    # SUPPORTED_ALGORITHMS(_SET) stay importable but are probed lazily.
+    if name == "SUPPORTED_ALGORITHMS":
+        return _fixed_digest_algorithms()
+    if name == "SUPPORTED_ALGORITHMS_SET":
+        return _supported_set()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Named constructors bind straight to the OpenSSL/HACL* implementations, which
+# pick up SHA-NI or ARMv8 crypto extensions where the CPU has them.
+_CONSTRUCTORS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+    "blake2b": hashlib.blake2b,
+    "blake2s": hashlib.blake2s,
+}
+# Fresh contexts to copy() from, skipping context allocation and init per hash.
+# Filled on first use, and only for algorithms that passed the import probe.
+_PRISTINE = {}
+
+
+def _new_hash(algorithm: str):
+    """Create a hash object, preferring the direct constructor when one exists."""
+    pristine = _PRISTINE.get(algorithm)
+    if pristine is None and algorithm in _CONSTRUCTORS and algorithm in _supported_set():
+        try:
+            pristine = _PRISTINE.setdefault(algorithm, _CONSTRUCTORS[algorithm]())
+        except ValueError:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    if pristine is not None:
+        return pristine.copy()
+    if algorithm == "blake3" and algorithm in _supported_set():
+        try:
+            import blake3
+        except Exception as exc:  # a broken install can raise anything
+            raise ValueError(f"Unsupported hash algorithm: {algorithm} ({exc})")
+        # Tree-structured, so large updates are split across all cores.
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if algorithm == "keccak_256" and algorithm in _supported_set():
+        # hashlib has no Keccak-256; the Numba kernel runs near native speed.
+        try:
+            from _numba_keccak import Keccak256
+        except Exception as exc:  # a broken numba/NumPy install can raise anything
+            raise ValueError(f"Unsupported hash algorithm: {algorithm} ({exc})")
+        return Keccak256()
     try:
-        h = hashlib.new(algorithm)
+        return hashlib.new(algorithm)
     except ValueError:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
-    with open(file_path, "rb") as f:
+
+def _nonblocking_opener(path, flags):
+    # O_NONBLOCK keeps open() from hanging on a FIFO with no writer.
+    return os.open(path, flags | getattr(os, "O_NONBLOCK", 0))
+
+
+class _RegularFile(io.FileIO):
+    """Unbuffered read-only file, checked to be a regular file when opened.
+
+    Unbuffered: we read in large chunks ourselves, so BufferedReader only adds
+    a copy. The fstat result is kept in ``info`` for the hashing code to reuse.
+    """
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path, "rb", opener=_nonblocking_opener)
+        try:
+            self.info = os.fstat(self.fileno())
+            if not stat.S_ISREG(self.info.st_mode):
+                # FIFOs and devices may never reach EOF; treat them like the
+                # old os.path.isfile() check did.
+                raise FileNotFoundError(errno.ENOENT, "Not a regular file", file_path)
+            if hasattr(os, "set_blocking"):
+                os.set_blocking(self.fileno(), True)
+        except BaseException:
+            self.close()
+            raise
+
+
+def _open_file(file_path: str) -> BinaryIO:
+    """Open a regular file for hashing; anything else raises FileNotFoundError."""
+    return _RegularFile(file_path)
+
+
+def compute_hash(file: Union[str, BinaryIO], algorithm: str, progress: bool = True) -> str:
+    """Compute hash of a file using the chosen algorithm.
+
+    Accepts a path or a binary file; a file passed in is hashed from its
+    current position to the end and left open for the caller to close. Large
+    or streamed inputs report progress on stderr when it is a terminal, unless
+    progress is False.
+    """
+    h = _new_hash(algorithm)
+    if isinstance(file, str):
+        with _open_file(file) as f:
+            return _hash_file(f, h, progress)
+    return _hash_file(file, h, progress)
+
+
+class _Progress:
+    """Rate-limited completion readout on stderr."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.done = 0
+        self._next = time.monotonic() + PROGRESS_INTERVAL
+        self._shown = False
+
+    def advance(self, n: int):
+        self.done += n
+        now = time.monotonic()
+        if now < self._next:
+            return
+        self._next = now + PROGRESS_INTERVAL
+        if self.size:
+            sys.stderr.write(f"\r{self.done / self.size:.1%}")
+        else:
+            sys.stderr.write(f"\r{self.done >> 20} MiB")
+        sys.stderr.flush()
+        self._shown = True
+
+    def finish(self):
+        if self._shown:
+            sys.stderr.write("\r\033[K")  # clear the readout before the report prints
+            sys.stderr.flush()
+
+
+def _progress_for(size: int, enabled: bool) -> Optional[_Progress]:
+    if enabled and sys.stderr.isatty():
+        return _Progress(size)
+    return None
+
+
+def _hash_file(f: BinaryIO, h, progress: bool) -> str:
+    try:
+        fd = f.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # In-memory stream, nothing to map or advise.
+        return _hash_stream(f, h, _progress_for(0, progress))
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Not supported for this file type; readahead hint only.
+    info = f.info if isinstance(f, _RegularFile) else os.fstat(fd)
+    if stat.S_ISREG(info.st_mode):
+        offset = f.tell()
+        if info.st_size - offset >= MMAP_THRESHOLD:
+            return _hash_mapped(f, h, offset, _progress_for(info.st_size - offset, progress))
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: file_digest runs its own readinto loop with a 256 KiB
+            # buffer (CHUNK_SIZE does not apply). Below MMAP_THRESHOLD that is at
+            # most 16 reads, and too quick to need a progress readout.
+            return hashlib.file_digest(f, lambda: h).hexdigest()
+        return _hash_read_loop(f, h)
+    return _hash_stream(f, h, _progress_for(info.st_size, progress))
+
+
+def hash_files(paths, algorithm: str) -> list[str]:
+    """Hash several files concurrently; returns hex digests in input order.
+
+    hashlib releases the GIL while digesting, so independent files occupy
+    separate cores instead of being hashed one after another.
+    """
+    paths = list(paths)
+    if len(paths) < 2:
+        return [compute_hash(path, algorithm) for path in paths]
+    # Imported here: concurrent.futures pulls in logging, a cost single-file runs skip.
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Concurrent progress readouts would overwrite each other.
+        return list(pool.map(lambda path: compute_hash(path, algorithm, progress=False), paths))
+
+
+def _hash_mapped(f, h, offset: int = 0, progress: Optional[_Progress] = None) -> str:
+    """Hash a regular file from offset in one update() call over a read-only mapping.
+
+    update() borrows the mapping through the buffer protocol, so whichever
+    backend does the hashing (OpenSSL, CPython's _blake2, blake3, the Keccak
+    kernel) reads the page-cache pages in place with no user-space copy.
+    With progress, the mapping is fed in PROGRESS_WINDOW slices instead.
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as whole, whole[offset:] as view:
+            if progress is None:
+                h.update(view)
+            else:
+                try:
+                    for start in range(0, len(view), PROGRESS_WINDOW):
+                        with view[start:start + PROGRESS_WINDOW] as window:
+                            h.update(window)
+                            progress.advance(len(window))
+                finally:
+                    progress.finish()
+    return h.hexdigest()
+
+
+def _hash_read_loop(f, h) -> str:
+    """Hash a small file with one reused buffer; not worth a reader thread."""
+    buf = bytearray(CHUNK_SIZE)
+    with memoryview(buf) as view:
         while True:
-            chunk = f.read(CHUNK_SIZE)
-            if not chunk:
+            n = f.readinto(buf)
+            if not n:
                 break
-            h.update(chunk)
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def _hash_stream(f, h, progress: Optional[_Progress] = None) -> str:
+    """Hash a stream while a reader thread fetches the next chunk.
 
+    update() releases the GIL on large buffers, so reading and hashing overlap.
+    A fixed pool of buffers is recycled between the two threads.
+    """
+    free = queue.Queue()
+    for _ in range(READ_BUFFERS):
+        free.put(bytearray(CHUNK_SIZE))
+    filled = queue.Queue()
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while True:
+                buf = free.get()
+                if stop.is_set():
+                    return
+                n = f.readinto(buf)
+                filled.put((buf, n))
+                if not n:
+                    return
+        except BaseException as exc:
+            filled.put((exc, 0))
+
+    worker = threading.Thread(target=reader, daemon=True)
+    worker.start()
+    try:
+        while True:
+            buf, n = filled.get()
+            if isinstance(buf, BaseException):
+                raise buf
+            if not n:
+                break
+            with memoryview(buf) as view:
+                h.update(view[:n])
+            free.put(buf)
+            if progress is not None:
+                progress.advance(n)
+    finally:
+        # Stop the reader before the caller closes the file, even if update()
+        # raised or the user hit Ctrl-C.
+        stop.set()
+        free.put(bytearray(0))  # wake a reader waiting for a buffer
+        worker.join()
+        if progress is not None:
+            progress.finish()
     return h.hexdigest()
 
 
-def display_intro():
-    print("")  # blank line before banner for readability
-    logo_lines = [
-        "░▀█▀░█▀▀░█▀▀░█▀▀░█▀█",
-        "░░█░░█▀▀░▀▀█░▀▀█░█▀█",
-        "░░▀░░▀▀▀░▀▀▀░▀▀▀░▀░▀",
-    ]
-    bunny_lines = _bunny_lines("Ready to hop into hashing!")
-    for logo_line, bunny_line in zip(logo_lines, bunny_lines):
-        print(f"{logo_line}   {bunny_line}")
-    print("\nTESSA THE HASH-BUN v0.1\n")
+def _emit(text: str):
+    """Write a block of text plus newline with a single write and flush."""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
 
 
-def _bunny_lines(status: str) -> list[str]:
+@functools.lru_cache(maxsize=8)
+def _bunny_lines(status: str) -> tuple[str, ...]:
     message = status or "Tessa says hello!"
-    return [
+    return (
         "  (\\_/)",
         f" (='.'=)  {message}",
         " (\")_(\")",
-    ]
+    )
+
+
+_LOGO_LINES = (
+    "░▀█▀░█▀▀░█▀▀░█▀▀░█▀█",
+    "░░█░░█▀▀░▀▀█░▀▀█░█▀█",
+    "░░▀░░▀▀▀░▀▀▀░▀▀▀░▀░▀",
+)
+_INTRO = "\n".join([
+    "",  # blank line before banner for readability
+    *(
+        f"{logo_line}   {bunny_line}"
+        for logo_line, bunny_line in zip(_LOGO_LINES, _bunny_lines("Ready to hop into hashing!"))
+    ),
+    "",
+    "TESSA THE HASH-BUN v0.1",
+    "",
+])
+_MENU = "Choose an option:\n  1. Compare hashes\n  2. Generate hash\n  3. Exit"
+
+
+def display_intro():
+    _emit(_INTRO)
 
 
 def print_bunny(status: str = ""):
@@ -74,32 +369,43 @@ def print_bunny(status: str = ""):
     print("\n".join(_bunny_lines(status or "Tessa says hello!")))
 
 
-def prompt_existing_file(message: str) -> Optional[str]:
+def prompt_existing_file(message: str) -> Optional[BinaryIO]:
+    """Prompt until a file opens; the caller owns (and closes) the returned file."""
     while True:
         path = input(message).strip()
         if not path:
             return None
-        if os.path.isfile(path):
-            return path
-        print("File not found. Please try again or press Enter to return to the menu.")
+        try:
+            return _open_file(path)
+        except (FileNotFoundError, IsADirectoryError):
+            print("File not found. Please try again or press Enter to return to the menu.")
+        except OSError as exc:
+            print(f"Could not open file: {exc}. Please try again or press Enter to return to the menu.")
 
 
 def prompt_expected_hash(message: str) -> Optional[str]:
     while True:
-        value = input(message).strip().lower()
+        value = input(message).strip()
         if not value:
             return None
         return value
 
 
-def prompt_algorithm(default: str = "sha256") -> Optional[str]:
-    popular = ("md5", "sha256", "sha512", "blake2b", "sha1")
-    popular_supported = [algo.upper() for algo in popular if algo in SUPPORTED_ALGORITHMS]
-    preview = ", ".join(popular_supported[:5])
-    prompt = (
+@functools.cache
+def _algorithm_prompt(default: str) -> str:
+    preview = ", ".join(
+        algo.upper()
+        for algo in ("blake2b", "sha256", "sha512", "md5", "sha1")
+        if algo in _supported_set()
+    )
+    return (
         f"Hash algorithm (Enter={default}. Popular: [{preview}] "
         "or 'back' to return): "
     )
+
+
+def prompt_algorithm(default: str = DEFAULT_ALGORITHM) -> Optional[str]:
+    prompt = _algorithm_prompt(default)
     while True:
         algo = input(prompt).strip().lower()
         if not algo:
@@ -108,104 +414,153 @@ def prompt_algorithm(default: str = "sha256") -> Optional[str]:
             return None
         if algo == "default":
             algo = default
-        if algo in SUPPORTED_ALGORITHMS:
+        if algo in _supported_set():
             return algo
         print("Unsupported algorithm. Try again.")
 
 
-def compare_and_report(file_path: str, expected_hash: str, algorithm: str) -> Optional[bool]:
-    """Compare hashes and print formatted output. Returns True/False/None for error."""
+def compare_and_report(
+    file: Union[str, BinaryIO], expected_hash: str, algorithm: str
+) -> Optional[bool]:
+    """Compare hashes and print formatted output. Returns True/False/None for error.
+
+    The expected hash is matched case-insensitively.
+    """
     print()
+    expected_hash = expected_hash.lower()  # hexdigest() is lowercase
+    # Catch malformed expected values before paying for a full file read.
+    try:
+        hex_length = _new_hash(algorithm).digest_size * 2
+    except ValueError as exc:
+        print(f"Error while computing hash: {exc}")
+        return None
+    if len(expected_hash) != hex_length:
+        print(
+            f"{RED}[FAIL]{RESET} Expected hash length {len(expected_hash)} doesn't match "
+            f"{algorithm}'s {hex_length} hex characters.\n"
+        )
+        return False
+    if not all(c in HEX_DIGITS for c in expected_hash):
+        print(f"{RED}[FAIL]{RESET} Expected hash must contain only hex digits (0-9, a-f).\n")
+        return False
     print_bunny("Tessa is checking your hash...")
     try:
-        actual_hash = compute_hash(file_path, algorithm).lower()
+        actual_hash = compute_hash(file, algorithm)
     except Exception as exc:
         print(f"Error while computing hash: {exc}")
         return None
 
     label_width = 10
-    print("")
-    print(f"{'Algorithm:'.ljust(label_width)} {algorithm}")
-    print(f"{'File:'.ljust(label_width)} {file_path}")
-    print(f"{'Expected:'.ljust(label_width)} {expected_hash}")
-    print(f"{'Actual:'.ljust(label_width)} {actual_hash}\n")
-
-    if actual_hash == expected_hash:
-        print(f"{GREEN}[OK]{RESET} Hashes match. Integrity verified.\n")
-        return True
+    report = [
+        "",
+        f"{'Algorithm:':<{label_width}} {algorithm}",
+        f"{'File:':<{label_width}} {getattr(file, 'name', file)}",
+        f"{'Expected:':<{label_width}} {expected_hash}",
+        f"{'Actual:':<{label_width}} {actual_hash}",
+        "",
+    ]
+    matched = hmac.compare_digest(actual_hash, expected_hash)
+    if matched:
+        report.append(f"{GREEN}[OK]{RESET} Hashes match. Integrity verified.")
     else:
-        print(f"{RED}[FAIL]{RESET} Hash mismatch. File may be corrupted or altered.")
-        print("Warning: Hash mismatch detected. Proceed with caution.\n")
-        return False
+        report.append(f"{RED}[FAIL]{RESET} Hash mismatch. File may be corrupted or altered.")
+        report.append("Warning: Hash mismatch detected. Proceed with caution.")
+    report.append("")
+    _emit("\n".join(report))
+    return matched
 
 
-def generate_and_report(file_path: str, algorithm: str) -> Optional[str]:
+def generate_and_report(file: Union[str, BinaryIO], algorithm: str) -> Optional[str]:
     """Generate a hash for the file and print it. Returns hash or None on error."""
     print()
     print_bunny("Tessa is generating your hash...")
     print()
     try:
-        actual_hash = compute_hash(file_path, algorithm).lower()
+        actual_hash = compute_hash(file, algorithm)
     except Exception as exc:
         print(f"Error while computing hash: {exc}")
         return None
 
     label_width = 10
-    print("")
-    print(f"{'Algorithm:'.ljust(label_width)} {algorithm}")
-    print(f"{'File:'.ljust(label_width)} {file_path}")
-    print(f"{'Hash:'.ljust(label_width)} {actual_hash}\n")
+    _emit("\n".join([
+        "",
+        f"{'Algorithm:':<{label_width}} {algorithm}",
+        f"{'File:':<{label_width}} {getattr(file, 'name', file)}",
+        f"{'Hash:':<{label_width}} {actual_hash}",
+        "",
+    ]))
     return actual_hash
 
 
+def generate_many_and_report(paths: list[str], algorithm: str) -> Optional[list[str]]:
+    """Hash several files concurrently and print one line per file.
+
+    Returns the hashes in input order, or None on error.
+    """
+    print()
+    print_bunny(f"Tessa is generating {len(paths)} hashes...")
+    print()
+    try:
+        hashes = hash_files(paths, algorithm)
+    except Exception as exc:
+        print(f"Error while computing hash: {exc}")
+        return None
+
+    label_width = 10
+    lines = ["", f"{'Algorithm:':<{label_width}} {algorithm}", ""]
+    lines.extend(f"{actual_hash}  {path}" for path, actual_hash in zip(paths, hashes))
+    lines.append("")
+    _emit("\n".join(lines))
+    return hashes
+
+
 def compare_hashes():
     print("\n== Compare Hashes ==")
-    file_path = prompt_existing_file(
+    file = prompt_existing_file(
         "Enter the path to the file (press Enter to return): "
     )
-    if file_path is None:
+    if file is None:
         print("No file selected. Returning to the main menu.\n")
         return
 
-    expected_hash = prompt_expected_hash(
-        "Enter the expected hash (press Enter to return): "
-    )
-    if expected_hash is None:
-        print("No expected hash entered. Returning to the main menu.\n")
-        return
+    with file:
+        expected_hash = prompt_expected_hash(
+            "Enter the expected hash (press Enter to return): "
+        )
+        if expected_hash is None:
+            print("No expected hash entered. Returning to the main menu.\n")
+            return
 
-    algorithm = prompt_algorithm()
-    if algorithm is None:
-        print("No algorithm selected. Returning to the main menu.\n")
-        return
+        algorithm = prompt_algorithm()
+        if algorithm is None:
+            print("No algorithm selected. Returning to the main menu.\n")
+            return
 
-    compare_and_report(file_path, expected_hash, algorithm)
+        compare_and_report(file, expected_hash, algorithm)
 
 
 def generate_hash():
     print("\n== Generate Hash ==")
-    file_path = prompt_existing_file(
+    file = prompt_existing_file(
         "Enter the path to the file (press Enter to return): "
     )
-    if file_path is None:
+    if file is None:
         print("No file selected. Returning to the main menu.\n")
         return
 
-    algorithm = prompt_algorithm()
-    if algorithm is None:
-        print("No algorithm selected. Returning to the main menu.\n")
-        return
+    with file:
+        algorithm = prompt_algorithm()
+        if algorithm is None:
+            print("No algorithm selected. Returning to the main menu.\n")
+            return
 
-    generate_and_report(file_path, algorithm)
+        generate_and_report(file, algorithm)
 
 
 def run_menu():
     display_intro()
     while True:
-        print("Choose an option:")
-        print("  1. Compare hashes")
-        print("  2. Generate hash")
-        print("  3. Exit")
+        _emit(_MENU)
         choice = input("Selection: ").strip()
         if choice == "1":
             compare_hashes()
@@ -224,7 +579,11 @@ def main():
     )
     parser.add_argument(
         "-f", "--file",
-        help="Path to the file you want to hash (enables non-interactive mode)"
+        nargs="+",
+        help=(
+            "Path to the file you want to hash (enables non-interactive mode); "
+            "several paths are hashed in parallel with --generate"
+        )
     )
     parser.add_argument(
         "-e", "--expected",
@@ -232,10 +591,13 @@ def main():
     )
     parser.add_argument(
         "-a", "--algo",
-        default="sha256",
+        default=DEFAULT_ALGORITHM,
         type=str.lower,
-        choices=SUPPORTED_ALGORITHMS,
-        help="Hash algorithm to use (default: sha256)"
+        choices=_fixed_digest_algorithms(),
+        help=(
+            f"Hash algorithm to use (default: {DEFAULT_ALGORITHM}; "
+            "~2x faster than sha256 on 64-bit CPUs, still cryptographic)"
+        )
     )
     parser.add_argument(
         "-g", "--generate",
@@ -244,27 +606,41 @@ def main():
     )
     args = parser.parse_args()
 
-    if args.file:
-        file_path = args.file
-        if not os.path.isfile(file_path):
-            print(f"Error: File not found: {file_path}")
+    if args.file and len(args.file) > 1:
+        if not args.generate:
+            print("Error: Several --file paths require --generate.")
             sys.exit(2)
-
-        algorithm = args.algo
         display_intro()
-        if args.generate:
-            result = generate_and_report(file_path, algorithm)
-            sys.exit(0 if result is not None else 2)
+        result = generate_many_and_report(args.file, args.algo)
+        sys.exit(0 if result is not None else 2)
 
-        if not args.expected:
-            print("Error: --expected is required unless --generate is used.")
+    if args.file:
+        file_path = args.file[0]
+        try:
+            file = _open_file(file_path)
+        except (FileNotFoundError, IsADirectoryError):
+            print(f"Error: File not found: {file_path}")
             sys.exit(2)
-
-        expected_hash = args.expected.strip().lower()
-        result = compare_and_report(file_path, expected_hash, algorithm)
-        if result is None:
+        except OSError as exc:
+            print(f"Error: Could not open file: {exc}")
             sys.exit(2)
-        sys.exit(0 if result else 1)
+
+        with file:
+            algorithm = args.algo
+            display_intro()
+            if args.generate:
+                result = generate_and_report(file, algorithm)
+                sys.exit(0 if result is not None else 2)
+
+            if not args.expected:
+                print("Error: --expected is required unless --generate is used.")
+                sys.exit(2)
+
+            expected_hash = args.expected.strip()
+            result = compare_and_report(file, expected_hash, algorithm)
+            if result is None:
+                sys.exit(2)
+            sys.exit(0 if result else 1)
 
     run_menu()
 
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+pytest.importorskip("numba")
+
+from _numba_keccak import Keccak256  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+        (b"hello world", "47173285a8d7341e5e972fc677286384f802f8ef42a5ec5f03bbfa254cb01fad"),
+    ],
+)
+def test_known_vectors(data, expected):
+    h = Keccak256()
+    h.update(data)
+    assert h.hexdigest() == expected
+
+
+def test_chunking_does_not_change_digest():
+    data = os.urandom(10_000)
+    whole = Keccak256()
+    whole.update(data)
+    pieces = Keccak256()
+    for start in range(0, len(data), 137):  # straddles the 136-byte rate
+        pieces.update(data[start:start + 137])
+    assert pieces.hexdigest() == whole.hexdigest()
+
+
+def test_copy_is_independent():
+    h = Keccak256()
+    h.update(b"hello")
+    clone = h.copy()
+    clone.update(b" world")
+    assert h.hexdigest() != clone.hexdigest()
+    assert clone.hexdigest() == "47173285a8d7341e5e972fc677286384f802f8ef42a5ec5f03bbfa254cb01fad"
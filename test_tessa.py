@@ -0,0 +1,256 @@
+import hashlib
+import importlib.machinery
+import io
+import os
+import subprocess
+import sys
+import threading
+import types
+
+import pytest
+
+import tessa
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    contents = [b"", b"hello world\n", bytes(range(256)) * 4096]
+    paths = []
+    for i, data in enumerate(contents):
+        path = tmp_path / f"sample{i}.bin"
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths, contents
+
+
+def test_hash_files_matches_hashlib_in_order(sample_files):
+    paths, contents = sample_files
+    expected = [hashlib.sha256(data).hexdigest() for data in contents]
+    assert tessa.hash_files(paths, "sha256") == expected
+
+
+def test_hash_files_single_and_empty(sample_files):
+    paths, contents = sample_files
+    assert tessa.hash_files(paths[1:2], "md5") == [hashlib.md5(contents[1]).hexdigest()]
+    assert tessa.hash_files([], "md5") == []
+
+
+def test_hash_files_propagates_errors(sample_files, tmp_path):
+    paths, _ = sample_files
+    with pytest.raises(FileNotFoundError):
+        tessa.hash_files(paths + [str(tmp_path / "missing")], "sha256")
+
+
+def test_compare_and_report_accepts_uppercase_expected(sample_files):
+    paths, contents = sample_files
+    expected = hashlib.sha256(contents[1]).hexdigest().upper()
+    assert tessa.compare_and_report(paths[1], expected, "sha256") is True
+
+
+def test_compare_and_report_rejects_malformed_expected(sample_files):
+    paths, _ = sample_files
+    assert tessa.compare_and_report(paths[1], "abc", "sha256") is False
+    assert tessa.compare_and_report(paths[1], "z" * 64, "sha256") is False
+
+
+def test_blocked_algorithm_is_unsupported(monkeypatch, sample_files):
+    # Simulates a FIPS build where md5 exists in hashlib but refuses to run.
+    def blocked(*args, **kwargs):
+        raise ValueError("disabled for FIPS")
+
+    monkeypatch.setitem(tessa._CONSTRUCTORS, "md5", blocked)
+    monkeypatch.setattr(tessa, "_PRISTINE", {})
+    supported = tessa.SUPPORTED_ALGORITHMS_SET - {"md5"}
+    monkeypatch.setattr(tessa, "_supported_set", lambda: supported)
+    real_new = hashlib.new
+    monkeypatch.setattr(
+        hashlib, "new", lambda name, *a, **k: blocked() if name == "md5" else real_new(name, *a, **k)
+    )
+    paths, contents = sample_files
+    with pytest.raises(ValueError, match="Unsupported hash algorithm: md5"):
+        tessa.compute_hash(paths[1], "md5")
+    assert tessa.compute_hash(paths[1], "sha256") == hashlib.sha256(contents[1]).hexdigest()
+
+
+@pytest.mark.parametrize("size", [1000, tessa.MMAP_THRESHOLD + 1000])
+def test_compute_hash_starts_at_current_position(tmp_path, size):
+    # Small files take the file_digest path, large ones the mmap path.
+    path = tmp_path / "data.bin"
+    data = bytes(range(256)) * (size // 256 + 1)
+    path.write_bytes(data)
+    with open(path, "rb") as f:
+        f.seek(100)
+        assert tessa.compute_hash(f, "sha256") == hashlib.sha256(data[100:]).hexdigest()
+
+
+@pytest.mark.skipif(not hasattr(tessa.os, "mkfifo"), reason="needs FIFOs")
+def test_open_file_rejects_fifo_without_blocking(tmp_path):
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    with pytest.raises(FileNotFoundError):
+        tessa._open_file(str(fifo))
+
+
+def test_numba_is_not_imported_at_startup():
+    # numba + NumPy add ~200 ms; they must load only when keccak_256 is used.
+    code = "import sys, tessa; print('numba' in sys.modules, '_numba_keccak' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(tessa.__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_broken_keccak_backend_is_unsupported(monkeypatch, sample_files):
+    supported = tessa.SUPPORTED_ALGORITHMS_SET | {"keccak_256"}
+    monkeypatch.setattr(tessa, "_supported_set", lambda: supported)
+    monkeypatch.setitem(sys.modules, "_numba_keccak", None)  # makes the import fail
+    paths, _ = sample_files
+    with pytest.raises(ValueError, match="Unsupported hash algorithm: keccak_256"):
+        tessa.compute_hash(paths[1], "keccak_256")
+
+
+def test_progress_is_cleared_when_hashing_fails(capsys):
+    class Failing:
+        def update(self, data):
+            raise OSError("read error")
+
+    progress = tessa._Progress(size=0)
+    progress._shown = True  # as if a percentage were already on screen
+    with pytest.raises(OSError):
+        tessa._hash_stream(io.BytesIO(b"x" * 10), Failing(), progress)
+    assert capsys.readouterr().err == "\r\033[K"
+
+
+STREAM_SIZE = tessa.CHUNK_SIZE * tessa.READ_BUFFERS + 12345  # forces buffer recycling
+
+
+def test_compute_hash_streams_in_memory_input():
+    data = os.urandom(STREAM_SIZE)
+    assert tessa.compute_hash(io.BytesIO(data), "sha256") == hashlib.sha256(data).hexdigest()
+
+
+def test_compute_hash_streams_pipe():
+    data = os.urandom(STREAM_SIZE)
+    read_fd, write_fd = os.pipe()
+
+    def writer():
+        with open(write_fd, "wb") as w:
+            w.write(data)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    with open(read_fd, "rb", buffering=0) as r:
+        digest = tessa.compute_hash(r, "sha256", progress=False)
+    thread.join()
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_algorithm_probe_is_deferred_and_cached():
+    code = "import tessa; print(tessa._fixed_digest_algorithms.cache_info().currsize)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(tessa.__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "0"
+    assert tessa.SUPPORTED_ALGORITHMS is tessa._fixed_digest_algorithms()
+    assert "sha256" in tessa.SUPPORTED_ALGORITHMS_SET
+
+
+def _run_cli(*args):
+    return subprocess.run(
+        [sys.executable, tessa.__file__, *args],
+        capture_output=True, text=True,
+    )
+
+
+def test_cli_generates_several_files(sample_files):
+    paths, contents = sample_files
+    result = _run_cli("--generate", "--algo", "sha256", "--file", *paths)
+    assert result.returncode == 0
+    for path, data in zip(paths, contents):
+        assert f"{hashlib.sha256(data).hexdigest()}  {path}" in result.stdout.splitlines()
+
+
+def test_cli_several_files_require_generate(sample_files):
+    paths, _ = sample_files
+    result = _run_cli("--file", *paths)
+    assert result.returncode == 2
+    assert "Several --file paths require --generate." in result.stdout
+
+
+@pytest.fixture
+def fresh_probe():
+    tessa._fixed_digest_algorithms.cache_clear()
+    tessa._supported_set.cache_clear()
+    yield
+    tessa._fixed_digest_algorithms.cache_clear()
+    tessa._supported_set.cache_clear()
+
+
+def test_blake3_dispatch_uses_all_threads(monkeypatch, fresh_probe, sample_files):
+    created = []
+
+    class FakeBlake3:
+        AUTO = -1
+        digest_size = 32
+
+        def __init__(self, max_threads=1):
+            created.append(max_threads)
+            self._inner = hashlib.sha256()
+
+        def update(self, data):
+            self._inner.update(data)
+
+        def hexdigest(self):
+            return self._inner.hexdigest()
+
+    module = types.ModuleType("blake3")
+    module.__spec__ = importlib.machinery.ModuleSpec("blake3", None)
+    module.blake3 = FakeBlake3
+    monkeypatch.setitem(sys.modules, "blake3", module)
+
+    assert "blake3" in tessa.SUPPORTED_ALGORITHMS
+    paths, contents = sample_files
+    assert tessa.compute_hash(paths[1], "blake3") == hashlib.sha256(contents[1]).hexdigest()
+    assert created == [FakeBlake3.AUTO]
+
+
+def test_blake3_is_not_imported_at_startup():
+    code = "import sys, tessa; print('blake3' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(tessa.__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_mapped_progress_reports_percentages(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(tessa, "PROGRESS_INTERVAL", 0)
+    monkeypatch.setattr(tessa, "PROGRESS_WINDOW", 1000)
+    data = os.urandom(4000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    with tessa._open_file(str(path)) as f:
+        digest = tessa._hash_mapped(f, hashlib.sha256(), 0, tessa._Progress(len(data)))
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert capsys.readouterr().err == "\r25.0%\r50.0%\r75.0%\r100.0%\r\033[K"
+
+
+def test_progress_reports_mib_for_unsized_input(monkeypatch, capsys):
+    monkeypatch.setattr(tessa, "PROGRESS_INTERVAL", 0)
+    progress = tessa._Progress(size=0)
+    progress.advance(3 << 20)
+    assert capsys.readouterr().err == "\r3 MiB"
+
+
+def test_progress_is_rate_limited(monkeypatch, capsys):
+    monkeypatch.setattr(tessa, "PROGRESS_INTERVAL", 3600)
+    progress = tessa._Progress(size=100)
+    for _ in range(10):
+        progress.advance(10)
+    progress.finish()
+    assert capsys.readouterr().err == ""